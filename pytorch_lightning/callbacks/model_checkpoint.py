@@ -297,14 +297,15 @@ class ModelCheckpoint(Callback):
 
     def on_train_epoch_end(self, trainer: "pl.Trainer", pl_module: "pl.LightningModule") -> None:
         """Save a checkpoint at the end of the training epoch."""
-        # as we advance one step at end of training, we use `global_step - 1` to avoid saving duplicates
-        trainer.fit_loop.global_step -= 1
         if (
-            not self._should_skip_saving_checkpoint(trainer)
-            and self._save_on_train_epoch_end
-            and self._every_n_epochs > 0
-            and (trainer.current_epoch + 1) % self._every_n_epochs == 0
+            not self._save_on_train_epoch_end
+            or self._every_n_epochs < 1
+            or (trainer.current_epoch + 1) % self._every_n_epochs != 0
         ):
+            return
+        # as we advance one step at end of training, we use `global_step - 1` to avoid saving duplicates
+        trainer.fit_loop.global_step -= 1
+        if not self._should_skip_saving_checkpoint(trainer):
             self.save_checkpoint(trainer)
         trainer.fit_loop.global_step += 1
 
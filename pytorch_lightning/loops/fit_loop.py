@@ -150,26 +150,32 @@ class FitLoop(Loop):
         Returns True if trainer.should_stop was set (e.g. by early stopping) or if the maximum number of steps or epochs
         is reached.
         """
-        # TODO(@awaelchli): Move track steps inside training loop and move part of these condition inside training loop
-        stop_steps = _is_max_limit_reached(self.global_step, self.max_steps)
-        stop_epochs = _is_max_limit_reached(self.current_epoch, self.max_epochs)
+        # this is polled frequently, so resolve the forwarding properties only once
+        global_step = self.global_step
+        current_epoch = self.current_epoch
 
-        should_stop = False
-        if self.trainer.should_stop:
+        should_stop = bool(self.trainer.should_stop)
+        if should_stop:
             # early stopping
-            met_min_epochs = self.current_epoch >= self.min_epochs if self.min_epochs else True
-            met_min_steps = self.global_step >= self.min_steps if self.min_steps else True
-            if met_min_epochs and met_min_steps:
-                should_stop = True
-            else:
+            min_steps = self.min_steps
+            met_min_epochs = current_epoch >= self.min_epochs if self.min_epochs else True
+            met_min_steps = global_step >= min_steps if min_steps else True
+            if not (met_min_epochs and met_min_steps):
                 log.info(
                     "Trainer was signaled to stop but required minimum epochs"
                     f" ({self.min_epochs}) or minimum steps ({self.min_steps}) has"
                     " not been met. Training will continue..."
                 )
-        self.trainer.should_stop = should_stop
+                # the signal is only written back when it needs to be rolled back
+                self.trainer.should_stop = should_stop = False
 
-        return stop_steps or should_stop or stop_epochs or self.trainer.num_training_batches == 0
+        # TODO(@awaelchli): Move track steps inside training loop and move part of these condition inside training loop
+        return (
+            should_stop
+            or _is_max_limit_reached(current_epoch, self.max_epochs)
+            or _is_max_limit_reached(global_step, self.max_steps)
+            or self.trainer.num_training_batches == 0
+        )
 
     @property
     def skip(self) -> bool:
@@ -207,11 +213,13 @@ class FitLoop(Loop):
             self.trainer.reset_train_dataloader(model)
         self._is_fresh_start_epoch = False
 
-        if self.trainer.train_dataloader is not None and callable(
-            getattr(self.trainer.train_dataloader.sampler, "set_epoch", None)
-        ):
+        # `CombinedLoader.sampler` collects the samplers on each access, so only look it up once
+        set_epoch = None
+        if self.trainer.train_dataloader is not None:
+            set_epoch = getattr(self.trainer.train_dataloader.sampler, "set_epoch", None)
+        if callable(set_epoch):
             # set seed for distributed sampler (enables shuffling for each epoch)
-            self.trainer.train_dataloader.sampler.set_epoch(self.current_epoch)
+            set_epoch(self.current_epoch)
 
         # changing gradient according accumulation_scheduler
         self.trainer.accumulation_scheduler.on_train_epoch_start(self.trainer, self.trainer.lightning_module)
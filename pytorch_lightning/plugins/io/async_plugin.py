@@ -0,0 +1,91 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+import torch
+
+from pytorch_lightning.plugins.io.checkpoint_plugin import CheckpointIO
+from pytorch_lightning.plugins.io.torch_plugin import TorchCheckpointIO
+from pytorch_lightning.utilities.apply_func import apply_to_collection
+from pytorch_lightning.utilities.types import _PATH
+
+
+class AsyncCheckpointIO(CheckpointIO):
+    """``AsyncCheckpointIO`` enables saving the checkpoints asynchronously in a thread.
+
+    The tensors of the checkpoint are copied to CPU on the calling thread so that training can safely continue to
+    update the parameters, and the serialization and file-write are then handed off to a background thread.
+    Removals are queued behind the pending saves, which are waited on before a checkpoint is loaded and when the
+    strategy is torn down. Saves and removals issued after the teardown, e.g. by the spawn strategies when they collect
+    the results or by :meth:`~pytorch_lightning.trainer.trainer.Trainer.save_checkpoint` once ``fit`` returned, run
+    synchronously since nothing waits for them anymore.
+
+    Args:
+        checkpoint_io: A checkpoint IO plugin that is used as the basis for async checkpointing.
+            Defaults to :class:`~pytorch_lightning.plugins.io.TorchCheckpointIO`.
+    """
+
+    def __init__(self, checkpoint_io: Optional[CheckpointIO] = None) -> None:
+        self.checkpoint_io = checkpoint_io if checkpoint_io is not None else TorchCheckpointIO()
+        # created lazily so that the plugin can be pickled, e.g. to spawn processes
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._futures: List[Future] = []
+        self._torn_down = False
+
+    def save_checkpoint(self, checkpoint: Dict[str, Any], path: _PATH, storage_options: Optional[Any] = None) -> None:
+        # snapshot the tensors synchronously, the optimizer might update them in-place while the thread is writing
+        snapshot = apply_to_collection(checkpoint, torch.Tensor, lambda t: t.detach().to("cpu", copy=True))
+        if hasattr(checkpoint.get("state_dict"), "_metadata"):
+            # `apply_to_collection` creates new mappings, keep the module versions needed by `load_state_dict`
+            snapshot["state_dict"]._metadata = checkpoint["state_dict"]._metadata
+        self._submit(self.checkpoint_io.save_checkpoint, snapshot, path, storage_options)
+
+    def load_checkpoint(self, path: _PATH, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        self._wait()
+        return self.checkpoint_io.load_checkpoint(path, *args, **kwargs)
+
+    def remove_checkpoint(self, path: _PATH) -> None:
+        # queued behind the pending saves instead of waiting for them, the single worker runs them in order
+        self._submit(self.checkpoint_io.remove_checkpoint, path)
+
+    def teardown(self) -> None:
+        """Waits for all pending saves and removals to finish, the ones issued afterwards run synchronously."""
+        self._wait()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        self._torn_down = True
+        self.checkpoint_io.teardown()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        # the executor and its futures cannot be pickled
+        state["_executor"] = None
+        state["_futures"] = []
+        return state
+
+    def _submit(self, fn: Callable, *args: Any) -> None:
+        if self._torn_down:
+            fn(*args)
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        self._futures.append(self._executor.submit(fn, *args))
+
+    def _wait(self) -> None:
+        futures, self._futures = self._futures, []
+        for future in futures:
+            # re-raises any exception that occurred in the thread
+            future.result()
@@ -60,3 +60,6 @@ class CheckpointIO(ABC):
         Args:
             path: Path to checkpoint
         """
+
+    def teardown(self) -> None:
+        """This method is called to teardown the process."""
@@ -15,11 +15,15 @@ import logging
 import os
 from typing import Any, Callable, Dict, Optional
 
+import torch
+
 import pytorch_lightning as pl
 from pytorch_lightning.plugins.io.checkpoint_plugin import CheckpointIO
 from pytorch_lightning.utilities import rank_zero_warn
+from pytorch_lightning.utilities.apply_func import apply_to_collection
 from pytorch_lightning.utilities.cloud_io import atomic_save, get_filesystem
 from pytorch_lightning.utilities.cloud_io import load as pl_load
+from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from pytorch_lightning.utilities.types import _PATH
 
 log = logging.getLogger(__name__)
@@ -27,11 +31,29 @@ log = logging.getLogger(__name__)
 
 class TorchCheckpointIO(CheckpointIO):
     """CheckpointIO that utilizes :func:`torch.save` and :func:`torch.load` to save and load checkpoints
-    respectively, common for most use cases."""
+    respectively, common for most use cases.
+
+    Args:
+        checkpoint_dtype: If set, the floating point tensors of the model's ``state_dict`` are cast to this dtype
+            before saving, e.g. ``torch.bfloat16`` to halve the size of the checkpoints of mixed precision runs.
+            They are cast back to the dtype of the parameters when the checkpoint is loaded into the model, but the
+            precision lost while saving is not recovered. Defaults to saving the tensors as they are.
+    """
+
+    # a class attribute so that subclasses that don't call `super().__init__()` keep working
+    checkpoint_dtype: Optional[torch.dtype] = None
+
+    def __init__(self, checkpoint_dtype: Optional[torch.dtype] = None) -> None:
+        if checkpoint_dtype is not None and not checkpoint_dtype.is_floating_point:
+            raise MisconfigurationException(
+                f"`checkpoint_dtype` must be a floating point dtype. You passed in {checkpoint_dtype}."
+            )
+        self.checkpoint_dtype = checkpoint_dtype
 
     def save_checkpoint(self, checkpoint: Dict[str, Any], path: _PATH, storage_options: Optional[Any] = None) -> None:
         fs = get_filesystem(path)
         fs.makedirs(os.path.dirname(path), exist_ok=True)
+        checkpoint = self._cast_state_dict(checkpoint)
         try:
             # write the checkpoint dictionary on the file
             atomic_save(checkpoint, path)
@@ -43,6 +65,19 @@ class TorchCheckpointIO(CheckpointIO):
             rank_zero_warn(f"Warning, `{key}` dropped from checkpoint. An attribute is not picklable: {err}")
             atomic_save(checkpoint, path)
 
+    def _cast_state_dict(self, checkpoint: Dict[str, Any]) -> Dict[str, Any]:
+        """Returns a shallow copy of the checkpoint with its ``state_dict`` cast to ``checkpoint_dtype``, if set."""
+        if self.checkpoint_dtype is None or "state_dict" not in checkpoint:
+            return checkpoint
+        state_dict = checkpoint["state_dict"]
+        casted = apply_to_collection(
+            state_dict, torch.Tensor, lambda t: t.to(self.checkpoint_dtype) if t.is_floating_point() else t
+        )
+        if hasattr(state_dict, "_metadata"):
+            # `apply_to_collection` creates new mappings, keep the module versions needed by `load_state_dict`
+            casted._metadata = state_dict._metadata
+        return {**checkpoint, "state_dict": casted}
+
     def load_checkpoint(
         self, path: _PATH, map_location: Optional[Callable] = lambda storage, loc: storage
     ) -> Dict[str, Any]:
@@ -40,6 +40,7 @@ class XLACheckpointIO(TorchCheckpointIO):
         """
         fs = get_filesystem(path)
         fs.makedirs(os.path.dirname(path), exist_ok=True)
+        checkpoint = self._cast_state_dict(checkpoint)
         # Todo: TypeError: 'mappingproxy' object does not support item assignment
         # Ref: https://github.com/pytorch/xla/issues/2773
         if _OMEGACONF_AVAILABLE:
@@ -438,6 +438,7 @@ class Strategy(ABC):
         """
         self._move_optimizer_state(torch.device("cpu"))
         self.precision_plugin.teardown()
+        self.checkpoint_io.teardown()
 
     @classmethod
     def register_plugins(cls, plugin_registry) -> None:
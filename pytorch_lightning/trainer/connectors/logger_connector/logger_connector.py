@@ -187,13 +187,15 @@ class LoggerConnector:
 
         # when metrics should be logged
         assert not self._epoch_end_reached
-        if self.should_update_logs or self.trainer.fast_dev_run:
+        if self.trainer.logger is not None and (self.should_update_logs or self.trainer.fast_dev_run):
             self.log_metrics(self.metrics["log"])
 
     def update_train_epoch_metrics(self) -> None:
         # add the metrics to the loggers
         assert self._epoch_end_reached
-        self.log_metrics(self.metrics["log"])
+        # avoid collecting the metrics when there is no logger to send them to
+        if self.trainer.logger is not None:
+            self.log_metrics(self.metrics["log"])
 
         # reset result collection for next epoch
         assert self.trainer._results is not None
@@ -61,10 +61,16 @@ class TensorRunningAccum:
         self.rotated: bool = False
 
     def reset(self, window_length: Optional[int] = None) -> None:
-        """Empty the accumulator."""
-        if window_length is None:
-            window_length = self.window_length
-        self.__init__(window_length)
+        """Empty the accumulator.
+
+        The allocated memory is kept and reused unless a different ``window_length`` is passed.
+        """
+        if window_length is not None and window_length != self.window_length:
+            self.window_length = window_length
+            self.memory = None
+        self.current_idx = 0
+        self.last_idx = None
+        self.rotated = False
 
     def last(self):
         """Get the last added element."""
@@ -73,7 +79,8 @@ class TensorRunningAccum:
 
     def append(self, x):
         """Add an element to the accumulator."""
-        if self.memory is None:
+        # the memory is reused across resets unless the shape of the elements changes
+        if self.memory is None or (self.last_idx is None and self.memory.shape[1:] != x.shape):
             self.memory = torch.zeros(self.window_length, *x.shape)
 
         # ensure same device and type
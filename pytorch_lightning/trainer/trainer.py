@@ -1564,11 +1564,12 @@ class Trainer(
             with self.profiler.profile(hook_name):
                 self._on_train_batch_end(*args, **kwargs)
         else:
+            # `pl_module` is resolved once instead of unwrapping the strategy's model for every callback
             for callback in self.callbacks:
                 fn = getattr(callback, hook_name)
                 if callable(fn):
                     with self.profiler.profile(f"[Callback]{callback.state_key}.{hook_name}"):
-                        fn(self, self.lightning_module, *args, **kwargs)
+                        fn(self, pl_module, *args, **kwargs)
 
         if pl_module:
             # restore current_fx when nested context
@@ -2021,8 +2022,10 @@ class Trainer(
     def checkpoint_callback(self) -> Optional[ModelCheckpoint]:
         """The first :class:`~pytorch_lightning.callbacks.model_checkpoint.ModelCheckpoint` callback in the
         Trainer.callbacks list, or ``None`` if it doesn't exist."""
-        callbacks = self.checkpoint_callbacks
-        return callbacks[0] if len(callbacks) > 0 else None
+        for c in self.callbacks:
+            if isinstance(c, ModelCheckpoint):
+                return c
+        return None
 
     @property
     def checkpoint_callbacks(self) -> List[ModelCheckpoint]:
@@ -60,4 +60,5 @@ def atomic_save(checkpoint: Dict[str, Any], filepath: Union[str, Path]) -> None:
     bytesbuffer = io.BytesIO()
     torch.save(checkpoint, bytesbuffer)
     with fsspec.open(filepath, "wb") as f:
-        f.write(bytesbuffer.getvalue())
+        # write the whole buffer at once through a zero-copy view instead of duplicating it with `getvalue()`
+        f.write(bytesbuffer.getbuffer())
@@ -1236,3 +1236,25 @@ def test_model_checkpoint_saveload_ckpt(tmpdir):
             assert getattr(cb_restore, key) == val
         else:
             assert getattr(cb_restore, key) != val
+
+
+@pytest.mark.parametrize(
+    ["save_on_train_epoch_end", "every_n_epochs", "current_epoch", "adjusted"],
+    [(True, 2, 0, False), (False, 1, 0, False), (True, 0, 0, False), (True, 2, 1, True), (True, 1, 0, True)],
+)
+def test_model_checkpoint_on_train_epoch_end_global_step(
+    save_on_train_epoch_end, every_n_epochs, current_epoch, adjusted
+):
+    """Test that the global step is only adjusted when a checkpoint can be saved at the end of the epoch."""
+    model_checkpoint = ModelCheckpoint(every_n_epochs=every_n_epochs)
+    model_checkpoint._save_on_train_epoch_end = save_on_train_epoch_end
+    trainer = Mock(current_epoch=current_epoch, fast_dev_run=True)
+    global_step = mock.PropertyMock(return_value=3)
+    type(trainer.fit_loop).global_step = global_step
+
+    model_checkpoint.on_train_epoch_end(trainer, Mock())
+
+    if adjusted:
+        global_step.assert_has_calls([call(), call(2), call(), call(4)])
+    else:
+        global_step.assert_not_called()
@@ -12,17 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
+import pickle
+import threading
 from typing import Any, Dict, Optional
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, Mock
 
+import pytest
 import torch
 
 from pytorch_lightning import Trainer
 from pytorch_lightning.callbacks import ModelCheckpoint
-from pytorch_lightning.plugins import CheckpointIO
+from pytorch_lightning.plugins import AsyncCheckpointIO, CheckpointIO, TorchCheckpointIO, XLACheckpointIO
 from pytorch_lightning.strategies import SingleDeviceStrategy
+from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from pytorch_lightning.utilities.types import _PATH
 from tests.helpers.boring_model import BoringModel
+from tests.helpers.runif import RunIf
 
 
 class CustomCheckpointIO(CheckpointIO):
@@ -79,3 +84,137 @@ def test_checkpoint_plugin_called(tmpdir):
     trainer.test(model, ckpt_path=ck.last_model_path)
     checkpoint_plugin.load_checkpoint.assert_called_once()
     checkpoint_plugin.load_checkpoint.assert_called_with(tmpdir / "last.ckpt")
+
+
+def test_async_checkpoint_plugin(tmpdir):
+    """Ensure that the ``AsyncCheckpointIO`` plugin saves a snapshot of the checkpoint and waits on teardown."""
+    checkpoint_plugin = AsyncCheckpointIO(Mock(wraps=TorchCheckpointIO(), spec=TorchCheckpointIO))
+
+    ck = ModelCheckpoint(dirpath=tmpdir, save_last=True)
+    model = BoringModel()
+    trainer = Trainer(default_root_dir=tmpdir, plugins=[checkpoint_plugin], callbacks=ck, max_epochs=2)
+    trainer.fit(model)
+
+    assert checkpoint_plugin.checkpoint_io.save_checkpoint.call_count == 5
+    assert checkpoint_plugin.checkpoint_io.remove_checkpoint.call_count == 1
+    checkpoint_plugin.checkpoint_io.teardown.assert_called()
+    assert not checkpoint_plugin._futures
+
+    checkpoint = torch.load(ck.last_model_path)
+    for name, param in model.state_dict().items():
+        assert torch.equal(checkpoint["state_dict"][name], param)
+
+    # the parameters are snapshotted when the save is requested
+    tensor = torch.ones(2)
+    snapshot_path = os.path.join(tmpdir, "snapshot.ckpt")
+    checkpoint_plugin.save_checkpoint({"tensor": tensor}, snapshot_path)
+    tensor.add_(1)
+    checkpoint_plugin.teardown()
+    assert torch.equal(torch.load(snapshot_path)["tensor"], torch.ones(2))
+
+
+def test_async_checkpoint_plugin_remove_does_not_wait():
+    """Ensure that removing a checkpoint gets queued behind the pending saves instead of waiting for them."""
+    saving = threading.Event()
+    checkpoint_io = Mock(spec=CheckpointIO)
+    checkpoint_io.save_checkpoint.side_effect = lambda *_: saving.wait(timeout=5)
+    checkpoint_plugin = AsyncCheckpointIO(checkpoint_io)
+
+    checkpoint_plugin.save_checkpoint({"tensor": torch.ones(2)}, "new.ckpt")
+    checkpoint_plugin.remove_checkpoint("old.ckpt")
+    # the save is still blocked, so the removal cannot have run yet
+    checkpoint_io.remove_checkpoint.assert_not_called()
+
+    saving.set()
+    checkpoint_plugin.teardown()
+    checkpoint_io.save_checkpoint.assert_called_once()
+    checkpoint_io.remove_checkpoint.assert_called_once_with("old.ckpt")
+
+
+@RunIf(skip_windows=True, skip_49370=True)
+def test_async_checkpoint_plugin_ddp_spawn(tmpdir):
+    """Ensure that the ``AsyncCheckpointIO`` plugin can be pickled to spawn processes."""
+    checkpoint_plugin = AsyncCheckpointIO()
+    # the executor of a plugin that already saved does not get pickled
+    checkpoint_plugin.save_checkpoint({"tensor": torch.ones(2)}, os.path.join(tmpdir, "before_spawn.ckpt"))
+    pickle.loads(pickle.dumps(checkpoint_plugin))
+
+    ck = ModelCheckpoint(dirpath=tmpdir, save_last=True)
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        strategy="ddp_spawn",
+        num_processes=2,
+        plugins=[checkpoint_plugin],
+        callbacks=ck,
+        max_epochs=1,
+        limit_train_batches=2,
+        limit_val_batches=2,
+    )
+    model = BoringModel()
+    trainer.fit(model)
+    assert os.path.isfile(os.path.join(tmpdir, "last.ckpt"))
+
+    # the last weights saved by the child process after the teardown were loaded back in the main process
+    last_state_dict = torch.load(os.path.join(tmpdir, "last.ckpt"))["state_dict"]
+    for name, param in model.state_dict().items():
+        assert torch.equal(param, last_state_dict[name])
+
+
+def test_async_checkpoint_plugin_after_teardown(tmpdir):
+    """Ensure that the ``AsyncCheckpointIO`` plugin saves and removes synchronously once torn down."""
+    checkpoint_plugin = AsyncCheckpointIO()
+    checkpoint_plugin.teardown()
+
+    checkpoint_path = os.path.join(tmpdir, "after_teardown.ckpt")
+    checkpoint_plugin.save_checkpoint({"tensor": torch.ones(2)}, checkpoint_path)
+    assert checkpoint_plugin._executor is None
+    assert torch.equal(torch.load(checkpoint_path)["tensor"], torch.ones(2))
+    # extra arguments are forwarded to the wrapped plugin
+    assert checkpoint_plugin.load_checkpoint(checkpoint_path, map_location="cpu")["tensor"].device.type == "cpu"
+
+    checkpoint_plugin.remove_checkpoint(checkpoint_path)
+    assert not os.path.exists(checkpoint_path)
+
+
+def test_torch_checkpoint_io_checkpoint_dtype(tmpdir):
+    """Ensure that ``TorchCheckpointIO(checkpoint_dtype=...)`` only casts the floating point weights."""
+    with pytest.raises(MisconfigurationException, match="must be a floating point dtype"):
+        TorchCheckpointIO(checkpoint_dtype=torch.int8)
+
+    model = torch.nn.BatchNorm1d(2)
+    state_dict = model.state_dict()
+    checkpoint = {"state_dict": state_dict, "optimizer_states": [{"state": {0: {"momentum": torch.ones(2)}}}]}
+    checkpoint_path = os.path.join(tmpdir, "model.ckpt")
+    TorchCheckpointIO(checkpoint_dtype=torch.bfloat16).save_checkpoint(checkpoint, checkpoint_path)
+    # the original checkpoint is not modified
+    assert checkpoint["state_dict"] is state_dict
+    assert state_dict["weight"].dtype == torch.float32
+
+    saved = torch.load(checkpoint_path)
+    assert saved["state_dict"]["weight"].dtype == torch.bfloat16
+    assert saved["state_dict"]["running_mean"].dtype == torch.bfloat16
+    assert saved["state_dict"]["num_batches_tracked"].dtype == torch.long
+    assert saved["state_dict"]._metadata == state_dict._metadata
+
+    class NoSuperInitCheckpointIO(TorchCheckpointIO):
+        def __init__(self):
+            pass
+
+    # subclasses that don't call `super().__init__()` save the tensors as they are
+    NoSuperInitCheckpointIO().save_checkpoint(checkpoint, checkpoint_path)
+    assert torch.load(checkpoint_path)["state_dict"]["weight"].dtype == torch.float32
+    assert saved["optimizer_states"][0]["state"][0]["momentum"].dtype == torch.float32
+
+    # the weights are cast back when loaded into the model
+    model.load_state_dict(saved["state_dict"])
+    assert model.weight.dtype == torch.float32
+    assert torch.equal(model.weight, torch.ones(2))
+
+
+@RunIf(tpu=True)
+def test_xla_checkpoint_io_checkpoint_dtype(tmpdir):
+    """Ensure that ``XLACheckpointIO`` also casts the floating point weights to the ``checkpoint_dtype``."""
+    checkpoint_path = os.path.join(tmpdir, "model.ckpt")
+    checkpoint = {"state_dict": torch.nn.Linear(2, 2).state_dict()}
+    XLACheckpointIO(checkpoint_dtype=torch.bfloat16).save_checkpoint(checkpoint, checkpoint_path)
+    assert torch.load(checkpoint_path)["state_dict"]["weight"].dtype == torch.bfloat16
@@ -1,6 +1,5 @@
 import os
 from typing import Any, Dict, Optional
-from unittest import mock
 
 import pytest
 import torch
@@ -24,19 +23,24 @@ def test_invalid_on_cpu(tmpdir):
         MisconfigurationException, match="You selected accelerator to be `ddp_fully_sharded`, but GPU is not available."
     ):
         trainer = Trainer(default_root_dir=tmpdir, fast_dev_run=True, strategy="fsdp")
-        assert isinstance(trainer.strategy, DDPFullyShardedStrategy)
+        assert type(trainer.strategy) is DDPFullyShardedStrategy
         trainer.strategy.setup_environment()
 
 
-@mock.patch.dict(os.environ, {"CUDA_VISIBLE_DEVICES": "0"})
-@mock.patch("torch.cuda.device_count", return_value=1)
-@mock.patch("torch.cuda.is_available", return_value=True)
+@pytest.fixture
+def single_cuda_device(monkeypatch):
+    """Pretend that a single CUDA device is available."""
+    monkeypatch.setenv("CUDA_VISIBLE_DEVICES", "0")
+    monkeypatch.setattr(torch.cuda, "device_count", lambda: 1)
+    monkeypatch.setattr(torch.cuda, "is_available", lambda: True)
+
+
 @RunIf(fairscale_fully_sharded=True)
-def test_fsdp_with_sharded_amp(device_count_mock, mock_cuda_available, tmpdir):
+def test_fsdp_with_sharded_amp(single_cuda_device, tmpdir):
     """Test to ensure that plugin native amp plugin is correctly chosen when using sharded."""
     trainer = Trainer(default_root_dir=tmpdir, fast_dev_run=True, strategy="fsdp", gpus=1, precision=16)
-    assert isinstance(trainer.strategy, DDPFullyShardedStrategy)
-    assert isinstance(trainer.strategy.precision_plugin, FullyShardedNativeMixedPrecisionPlugin)
+    assert type(trainer.strategy) is DDPFullyShardedStrategy
+    assert type(trainer.strategy.precision_plugin) is FullyShardedNativeMixedPrecisionPlugin
 
 
 class TestFSDPModel(BoringModel):
@@ -95,7 +99,16 @@ def test_fully_sharded_strategy_checkpoint(tmpdir):
     """Test to ensure that checkpoint is saved correctly when using a single GPU, and all stages can be run."""
 
     model = TestFSDPModel()
-    trainer = Trainer(default_root_dir=tmpdir, gpus=1, strategy="fsdp", precision=16, max_epochs=1)
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        gpus=1,
+        strategy="fsdp",
+        precision=16,
+        max_epochs=1,
+        limit_train_batches=2,
+        limit_val_batches=2,
+        limit_test_batches=2,
+    )
     _run_multiple_stages(trainer, model, os.path.join(tmpdir, "last.ckpt"))
 
 
@@ -105,20 +118,38 @@ def test_fully_sharded_strategy_checkpoint_multi_gpus(tmpdir):
 
     model = TestFSDPModel()
     ck = ModelCheckpoint(save_last=True)
-    trainer = Trainer(default_root_dir=tmpdir, gpus=2, strategy="fsdp", precision=16, max_epochs=1, callbacks=[ck])
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        gpus=2,
+        strategy="fsdp",
+        precision=16,
+        max_epochs=1,
+        limit_train_batches=2,
+        limit_val_batches=2,
+        limit_test_batches=2,
+        callbacks=[ck],
+    )
     _run_multiple_stages(trainer, model)
 
 
-def _assert_save_equality(trainer, ckpt_path, cls=TestFSDPModel):
+def _assert_save_equality(trainer, ckpt_path):
     # Use FullySharded to get the state dict for the sake of comparison
     model_state_dict = trainer.strategy.lightning_module_state_dict()
 
     if trainer.is_global_zero:
-        saved_model = cls.load_from_checkpoint(ckpt_path)
+        # compare against the saved state dict directly instead of instantiating a second model from it
+        saved_state_dict = torch.load(ckpt_path, map_location="cpu")["state_dict"]
+        assert model_state_dict.keys() == saved_state_dict.keys()
+
+        # Assert the saved parameters are identical to the model's. The parameters are flattened into a single
+        # tensor on their device so that they are moved and compared at once instead of one by one
+        keys = list(model_state_dict)
+        model_params = torch.cat([model_state_dict[k].flatten().float() for k in keys]).cpu()
+        saved_params = torch.cat([saved_state_dict[k].flatten().float() for k in keys])
+        assert torch.equal(model_params, saved_params)
 
-        # Assert model parameters are identical after loading
-        for ddp_param, shard_param in zip(model_state_dict.values(), saved_model.state_dict().values()):
-            assert torch.equal(ddp_param.float().cpu(), shard_param)
+    # make the other ranks wait until the checkpoint has been read and compared on rank 0
+    trainer.strategy.barrier("assert_save_equality")
 
 
 def _run_multiple_stages(trainer, model, model_path: Optional[str] = None):
@@ -128,7 +159,7 @@ def _run_multiple_stages(trainer, model, model_path: Optional[str] = None):
 
     trainer.save_checkpoint(model_path, weights_only=True)
 
-    _assert_save_equality(trainer, model_path, cls=TestFSDPModel)
+    _assert_save_equality(trainer, model_path)
 
     # Test entry point
     trainer.test(model)  # model is wrapped, will not call configure_shared_model
@@ -51,8 +51,24 @@ def test_tensor_running_accum_reset():
     assert accum.last() == torch.tensor(1.5)
     assert accum.mean() == torch.tensor(1.5)
 
+    memory = accum.memory
     accum.reset()
     assert accum.window_length == window_length
+    # the memory is reused
+    assert accum.memory is memory
+    assert accum.current_idx == 0
+    assert accum.last_idx is None
+    assert not accum.rotated
+    assert accum.last() is None
+    assert accum.mean() is None
+
+    accum.append(torch.tensor(2.5))
+    assert accum.memory is memory
+    assert accum.last() == torch.tensor(2.5)
+    assert accum.mean() == torch.tensor(2.5)
+
+    accum.reset(window_length=window_length + 1)
+    assert accum.window_length == window_length + 1
     assert accum.memory is None
     assert accum.current_idx == 0
     assert accum.last_idx is None